@@ -0,0 +1,150 @@
+import numpy as np
+import pandas as pd
+from .build_features import get_cultural_heartbeat
+from .params import DOMAIN_NAMES
+from .trend_panel import TrendPanel
+
+# Numeric columns that are targets rather than signals, kept out of the heartbeat
+NON_SIGNAL_COLS = ["axis_label"]
+
+
+class DomainHeartbeat:
+    """
+    Per-domain, per-month Order↔Novelty heartbeat.
+
+    Keeps running sums and counts of the row heartbeat on a
+    (domains × months) grid, filled with np.bincount over precomputed
+    domain/month group codes. New rows only touch the grid through another
+    bincount, and only the curves of the domains they touch are recomputed.
+    """
+
+    def __init__(self, domains=DOMAIN_NAMES):
+        self.domains = list(domains)
+        self.months = np.array([], dtype=object)
+        self._sums = np.zeros((len(self.domains), 0))
+        self._counts = np.zeros((len(self.domains), 0), dtype=np.int64)
+        self._domain_lookup = {name: i for i, name in enumerate(self.domains)}
+        self._cache = {}
+        self._total = None
+
+    # ------------------------------------------------------------------
+    # 1. CONSTRUCTION
+    # ------------------------------------------------------------------
+    @classmethod
+    def from_frame(cls, df: pd.DataFrame, domains=DOMAIN_NAMES):
+        hb = cls(domains)
+        hb.add_rows(df)
+        return hb
+
+    @classmethod
+    def from_panel(cls, panel: TrendPanel, domains=DOMAIN_NAMES):
+        """Build from a TrendPanel using its row heartbeat and metadata codes."""
+        hb = cls(domains)
+        features = [f for f in panel.feature_names if f not in NON_SIGNAL_COLS]
+        row_domains = panel.domain_names[panel.domain_codes[panel.row_trends()]]
+        row_months = panel.timestamps[panel.timestamp_codes]
+        # The panel codes missing metadata as "", which is not a real domain or month
+        known = (row_domains != "") & (row_months != "")
+        hb._accumulate(
+            row_domains[known],
+            row_months[known],
+            panel.heartbeat(features).astype(float)[known],
+        )
+        return hb
+
+    # ------------------------------------------------------------------
+    # 2. INCREMENTAL UPDATES
+    # ------------------------------------------------------------------
+    def add_rows(self, df: pd.DataFrame):
+        """Fold new rows (normalized like load_trend_data output) into the grid."""
+        for col in ["domain", "timestamp"]:
+            if col not in df.columns:
+                raise ValueError(f"Column '{col}' is required for domain heartbeats.")
+        # Rows without a domain or month cannot be placed on the grid
+        df = df[df[["domain", "timestamp"]].notna().all(axis=1)]
+        if len(df) == 0:
+            return
+        self._accumulate(
+            df["domain"].astype(str).to_numpy(),
+            df["timestamp"].astype(str).to_numpy(),
+            get_cultural_heartbeat(df.drop(columns=NON_SIGNAL_COLS, errors="ignore")),
+        )
+
+    def _accumulate(self, domains, months, values):
+        values = np.asarray(values, dtype=float)
+        keep = ~np.isnan(values)
+        domains, months, values = domains[keep], months[keep], values[keep]
+        if len(values) == 0:
+            return
+
+        # Group codes are computed on the unique values only, then broadcast
+        domain_idx, domain_uniques = pd.factorize(domains)
+        month_idx, month_uniques = pd.factorize(months)
+
+        # factorize codes missing values as -1, which would index the last domain/month
+        placed = (domain_idx >= 0) & (month_idx >= 0)
+        if not placed.all():
+            domain_idx, domain_uniques = pd.factorize(domains[placed])
+            month_idx, month_uniques = pd.factorize(months[placed])
+            values = values[placed]
+            if len(values) == 0:
+                return
+
+        # Register unseen domains and months, re-indexing the grid if needed
+        new_domains = [d for d in domain_uniques if d not in self._domain_lookup]
+        for d in new_domains:
+            self._domain_lookup[d] = len(self.domains)
+            self.domains.append(d)
+        new_months = np.setdiff1d(np.asarray(month_uniques, dtype=object), self.months)
+        if len(new_months) or new_domains:
+            self._grow(np.union1d(self.months, new_months).astype(object))
+
+        domain_codes = np.array([self._domain_lookup[d] for d in domain_uniques])
+        row_domains = domain_codes[domain_idx]
+        row_months = np.searchsorted(self.months, np.asarray(month_uniques, dtype=object))[month_idx]
+
+        n_months = len(self.months)
+        group = row_domains * n_months + row_months
+        size = len(self.domains) * n_months
+        self._sums += np.bincount(group, weights=values, minlength=size).reshape(-1, n_months)
+        self._counts += np.bincount(group, minlength=size).reshape(-1, n_months)
+
+        if len(new_months):
+            # The shared month axis changed, so every cached curve is stale
+            self._cache.clear()
+        else:
+            for d in domain_codes:
+                self._cache.pop(self.domains[d], None)
+        self._total = None
+
+    def _grow(self, months):
+        sums = np.zeros((len(self.domains), len(months)))
+        counts = np.zeros((len(self.domains), len(months)), dtype=np.int64)
+        old = np.searchsorted(months, self.months)
+        n_old = self._sums.shape[0]
+        sums[:n_old, old] = self._sums
+        counts[:n_old, old] = self._counts
+        self.months, self._sums, self._counts = months, sums, counts
+
+    # ------------------------------------------------------------------
+    # 3. QUERIES
+    # ------------------------------------------------------------------
+    def domain(self, name):
+        """Mean heartbeat per month for one domain (NaN for months without rows)."""
+        if name not in self._cache:
+            d = self._domain_lookup[name]
+            with np.errstate(invalid="ignore", divide="ignore"):
+                self._cache[name] = self._sums[d] / self._counts[d]
+        return self._cache[name]
+
+    def heartbeats(self, domains=None):
+        """Return (months, {domain: curve}) for every requested domain."""
+        domains = self.domains if domains is None else domains
+        return self.months, {name: self.domain(name) for name in domains}
+
+    def total(self):
+        """Mean heartbeat per month across all domains."""
+        if self._total is None:
+            with np.errstate(invalid="ignore", divide="ignore"):
+                self._total = self._sums.sum(axis=0) / self._counts.sum(axis=0)
+        return self._total
@@ -1,3 +1,4 @@
+import json
 import numpy as np
 import joblib
 import re
@@ -82,27 +83,166 @@ def generate_forecast(model, base_features, scenario_text, months=60):
 # ---------------------------------------------------------
 # 5. Graph explanation generator
 # ---------------------------------------------------------
+VOLATILITY_THRESHOLD = 0.3
+
+_DIRECTIONS = {
+    "Novelty": "upward (toward creativity and experimentation)",
+    "Order": "downward (toward tradition and structure)",
+}
+
+
+def _render_explanation(volatility, label):
+    direction = _DIRECTIONS["Novelty"] if label == "Novelty" else _DIRECTIONS["Order"]
+    return f"The curve shows a {volatility} movement leaning {direction} — suggesting that society is entering a {label}-dominated phase."
+
+
 def explain_graph(signal, t, label):
     """Generate a simple language description of the waveform."""
-    direction = "upward (toward creativity and experimentation)" if label == "Novelty" else "downward (toward tradition and structure)"
-    volatility = "steady" if np.std(signal) < 0.3 else "highly dynamic"
-    return f"The curve shows a {volatility} movement leaning {direction} — suggesting that society is entering a {label}-dominated phase."
+    volatility = "steady" if np.std(signal) < VOLATILITY_THRESHOLD else "highly dynamic"
+    return _render_explanation(volatility, label)
 
 
 # ---------------------------------------------------------
 # 6. Human-readable summary
 # ---------------------------------------------------------
-def describe_prediction(label, confidence=0.7, data=None, model=None):
-    """Summarize what the AI thinks and why."""
-    if label == "Novelty":
-        tone = "Creativity and experimentation are on the rise."
-        implication = "Expect new ideas, unconventional design, and youthful energy."
-    else:
-        tone = "Cultural focus is turning toward structure and stability."
-        implication = "Expect classic aesthetics, tradition revival, and long-term values."
-
+_OUTLOOKS = {
+    "Novelty": (
+        "Creativity and experimentation are on the rise.",
+        "Expect new ideas, unconventional design, and youthful energy.",
+    ),
+    "Order": (
+        "Cultural focus is turning toward structure and stability.",
+        "Expect classic aesthetics, tradition revival, and long-term values.",
+    ),
+}
+
+
+def _render_outlook(label):
+    tone, implication = _OUTLOOKS["Novelty"] if label == "Novelty" else _OUTLOOKS["Order"]
     return (
         f"**Model Interpretation:** {tone}\n\n"
         f"**Cultural Outlook:** {implication}\n\n"
-        f"**Confidence:** {confidence:.0%}"
+        f"**Confidence:** "
     )
+
+
+def describe_prediction(label, confidence=0.7, data=None, model=None):
+    """Summarize what the AI thinks and why."""
+    return f"{_render_outlook(label)}{confidence:.0%}"
+
+
+# ---------------------------------------------------------
+# 7. Batch narratives (nightly report generation)
+# ---------------------------------------------------------
+# Pre-rendered fragments, indexed by code = 2 * is_novelty + is_dynamic
+# for explanations and by is_novelty for outlooks.
+_LABELS = np.array(["Order", "Novelty"], dtype=object)
+_EXPLANATIONS = np.array(
+    [_render_explanation(vol, label) for label in ("Order", "Novelty") for vol in ("steady", "highly dynamic")],
+    dtype=object,
+)
+_OUTLOOK_PREFIXES = np.array([_render_outlook("Order"), _render_outlook("Novelty")], dtype=object)
+_PERCENTS = np.array([f"{p}%" for p in range(101)], dtype=object)
+
+
+def predict_axis_batch(model, features):
+    """
+    Vectorized predict_axis over a (n_rows, n_features) matrix.
+    Returns (labels, confidences, predictions) as arrays of length n_rows.
+    """
+    X = np.asarray(features, dtype=float)
+    if X.ndim == 1:
+        X = X.reshape(1, -1)
+    predictions = np.asarray(model.predict(X), dtype=float)
+    labels = _LABELS[(predictions >= 0).astype(np.intp)]
+    confidences = np.minimum(1.0, np.abs(predictions))
+    return labels, confidences, predictions
+
+
+def _novelty_mask(labels):
+    """Boolean Novelty mask; rejects labels the pre-rendered fragments don't cover."""
+    labels = np.asarray(labels)
+    is_novelty = labels == "Novelty"
+    unknown = ~is_novelty & (labels != "Order")
+    if unknown.any():
+        raise ValueError(f"Unknown axis label(s): {sorted(set(labels[unknown].tolist()))}. Expected 'Order' or 'Novelty'.")
+    return is_novelty
+
+
+def explain_graph_batch(signals, labels):
+    """
+    Vectorized explain_graph for a (n_rows, n_points) array of waveforms.
+    Volatility is computed row-wise in a single np.std call.
+    """
+    signals = np.asarray(signals, dtype=float)
+    if signals.ndim == 1:
+        signals = signals.reshape(1, -1)
+    volatility = np.std(signals, axis=1)
+    is_novelty = _novelty_mask(labels)
+    # ~(v < threshold) rather than v >= threshold so NaN reads "highly dynamic" like explain_graph
+    codes = 2 * is_novelty.astype(np.intp) + ~(volatility < VOLATILITY_THRESHOLD)
+    return _EXPLANATIONS[codes], volatility
+
+
+def _format_percents(confidences):
+    """Format confidences like f"{c:.0%}", using the cached 0-100% strings."""
+    confidences = np.asarray(confidences, dtype=float)
+    pct = np.rint(confidences * 100)
+    # signbit sends -0.0 (e.g. -0.004) to the slow path, which prints "-0%"
+    in_range = ~np.signbit(pct) & (pct <= 100)
+    out = np.empty(len(confidences), dtype=object)
+    out[in_range] = _PERCENTS[pct[in_range].astype(np.intp)]
+    for i in np.flatnonzero(~in_range):
+        out[i] = f"{confidences[i]:.0%}"
+    return out
+
+
+def describe_prediction_batch(labels, confidences):
+    """Vectorized describe_prediction for arrays of labels and confidences."""
+    is_novelty = _novelty_mask(labels)
+    return _OUTLOOK_PREFIXES[is_novelty.astype(np.intp)] + _format_percents(confidences)
+
+
+def iter_narratives(model, features, signals, keys=None, chunk_size=10000):
+    """
+    Yield one narrative dict per row, processing rows in chunks so that
+    features/signals can be large arrays (or np.memmap) without copying
+    everything into memory at once.
+    """
+    n_rows = len(features)
+    if len(signals) != n_rows:
+        raise ValueError("features and signals must have the same number of rows.")
+    if keys is not None and len(keys) != n_rows:
+        raise ValueError("keys must have the same number of rows as features.")
+
+    for start in range(0, n_rows, chunk_size):
+        stop = min(start + chunk_size, n_rows)
+        labels, confidences, predictions = predict_axis_batch(model, features[start:stop])
+        explanations, volatility = explain_graph_batch(signals[start:stop], labels)
+        summaries = describe_prediction_batch(labels, confidences)
+        chunk_keys = np.asarray(keys[start:stop]).tolist() if keys is not None else range(start, stop)
+
+        for key, label, conf, pred, vol, expl, summ in zip(
+            chunk_keys, labels, confidences.tolist(), predictions.tolist(),
+            volatility.tolist(), explanations, summaries,
+        ):
+            yield {
+                "key": key,
+                "label": label,
+                "confidence": conf,
+                "prediction": pred,
+                "volatility": vol,
+                "explanation": expl,
+                "summary": summ,
+            }
+
+
+def write_narratives_jsonl(path, model, features, signals, keys=None, chunk_size=10000):
+    """Stream batch narratives to a JSONL file. Returns the number of rows written."""
+    count = 0
+    with open(path, "w", encoding="utf-8") as f:
+        for record in iter_narratives(model, features, signals, keys=keys, chunk_size=chunk_size):
+            f.write(json.dumps(record, ensure_ascii=False))
+            f.write("\n")
+            count += 1
+    return count
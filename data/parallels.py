@@ -1,22 +1,34 @@
 import numpy as np, pandas as pd
+from .trend_panel import TrendPanel
+
+PARALLEL_FEATS = ["gt_search","tiktok_views","youth_proxy","novelty_kw_density","order_kw_density"]
+PARALLEL_LAGS = [(120,"par_sim_10y"), (240,"par_sim_20y")]
+
+def panel_parallel_sims(panel: TrendPanel, feats=PARALLEL_FEATS, lags=PARALLEL_LAGS) -> dict:
+    """
+    Cosine similarity of each month with the same trend ``delta`` months earlier,
+    computed over the whole panel at once. Returns {col: per-panel-row array},
+    0.0 where no earlier month exists.
+    """
+    X = panel.values[:, [panel.feature_index(f) for f in feats]]
+    norms = np.linalg.norm(X, axis=1)
+    positions = panel.row_positions()
+    sims = {}
+    for delta, col in lags:
+        out = np.zeros(len(X), dtype=X.dtype)
+        if delta < len(X):
+            num = (X[delta:] * X[:-delta]).sum(axis=1)
+            den = norms[delta:] * norms[:-delta] + 1e-9
+            # row r and r - delta belong to the same trend iff r sits >= delta into it
+            out[delta:] = np.where(positions[delta:] >= delta, num / den, 0.0)
+        sims[col] = out
+    return sims
 
 def add_parallel_sims(df: pd.DataFrame) -> pd.DataFrame:
     df = df.sort_values(["trend_id","timestamp"])
     # naive baseline: correlation with same month ±120/±240 across features
-    feats = ["gt_search","tiktok_views","youth_proxy","novelty_kw_density","order_kw_density"]
-    df["par_sim_10y"] = 0.0
-    df["par_sim_20y"] = 0.0
-    for tid, g in df.groupby("trend_id"):
-        g = g.reset_index(drop=True)
-        for i in range(len(g)):
-            # look back 120 and 240 months if present
-            for delta, col in [(120,"par_sim_10y"), (240,"par_sim_20y")]:
-                j = i - delta
-                if 0 <= j < len(g):
-                    a = g.loc[i,feats].values.astype(float)
-                    b = g.loc[j,feats].values.astype(float)
-                    num = (a*b).sum()
-                    den = (np.linalg.norm(a)*np.linalg.norm(b) + 1e-9)
-                    g.loc[i,col] = num/den
-        df.loc[g.index, ["par_sim_10y","par_sim_20y"]] = g[["par_sim_10y","par_sim_20y"]].values
+    # domain is left out: the lags only follow trend_id, so no domain grouping is needed
+    panel = TrendPanel.from_frame(df[["trend_id", "timestamp", *PARALLEL_FEATS]], features=PARALLEL_FEATS, dtype=np.float64)
+    for col, rows in panel_parallel_sims(panel).items():
+        df[col] = panel.to_rows(rows)
     return df
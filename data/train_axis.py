@@ -5,6 +5,7 @@ from sklearn.linear_model import Ridge
 from sklearn.metrics import r2_score, mean_absolute_error
 from sklearn.model_selection import train_test_split
 from pathlib import Path
+from .trend_panel import TrendPanel
 
 # These should match the features built in your build_features.py
 FEATURES = [
@@ -29,6 +30,7 @@ def load_and_build(csv_path="data/features.csv"):
 def main():
     df = load_and_build()
     df = df.dropna(subset=["axis_label"])
+    panel = TrendPanel.from_frame(df, dtype=np.float64)
 
     # Construct the feature matrix (X) and target vector (y)
     lag_cols = [
@@ -36,15 +38,15 @@ def main():
         for c in ["gt_search", "tiktok_views", "youth_proxy", "shock_signed"]
         for L in (1, 3, 6)
     ]
-    available_lags = [col for col in lag_cols if col in df.columns]
-    feature_cols = [col for col in FEATURES + available_lags if col in df.columns]
+    available_lags = [col for col in lag_cols if col in panel.feature_names]
+    feature_cols = [col for col in FEATURES + available_lags if col in panel.feature_names]
 
-    X = df[feature_cols].values
-    y = df["axis_label"].values
+    X = panel.matrix(feature_cols)
+    y = panel.column("axis_label")
 
     # Simple random 80/20 train-test split
     train_idx, test_idx = train_test_split(
-        np.arange(len(df)), test_size=0.2, random_state=42
+        np.arange(panel.n_rows), test_size=0.2, random_state=42
     )
 
     # Train Ridge regression model
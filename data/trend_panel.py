@@ -0,0 +1,175 @@
+import numpy as np
+import pandas as pd
+from .build_features import load_trend_data
+
+
+class TrendPanel:
+    """
+    Compact array-backed view of the trend dataset.
+
+    Numeric features live in one contiguous (rows × features) array with rows
+    grouped by trend and ordered in time, so trend i occupies
+    values[offsets[i]:offsets[i + 1]] and ragged lengths cost no padding.
+    Trends are ordered by (domain, trend_id) so every domain is a contiguous
+    block, and text metadata is stored as integer codes into category arrays.
+    """
+
+    def __init__(self, values, offsets, feature_names, trend_ids, domain_codes, domain_names,
+                 timestamp_codes, timestamps, blurb_codes, blurbs, source_rows):
+        self.values = values
+        self.offsets = offsets
+        self.lengths = np.diff(offsets)
+        self.feature_names = list(feature_names)
+        self.trend_ids = trend_ids
+        self.domain_codes = domain_codes
+        self.domain_names = domain_names
+        # Trend index range of each domain; row range is offsets[domain_offsets[d]]
+        self.domain_offsets = np.searchsorted(domain_codes, np.arange(len(domain_names) + 1))
+        self.timestamp_codes = timestamp_codes
+        self.timestamps = timestamps
+        self.blurb_codes = blurb_codes
+        self.blurbs = blurbs
+        # Panel row holding each source row, used to gather results back
+        self.source_rows = source_rows
+
+        self._feature_lookup = {name: i for i, name in enumerate(self.feature_names)}
+        self._trend_lookup = {tid: i for i, tid in enumerate(trend_ids)}
+        self._domain_lookup = {name: i for i, name in enumerate(domain_names)}
+
+    # ------------------------------------------------------------------
+    # 1. CONSTRUCTION
+    # ------------------------------------------------------------------
+    @classmethod
+    def from_frame(cls, df: pd.DataFrame, features=None, dtype=np.float32):
+        """
+        Build a panel from a DataFrame like the one load_trend_data returns.
+        Pass dtype=np.float64 where results must match the DataFrame exactly.
+        """
+        if "trend_id" not in df.columns:
+            raise ValueError("A 'trend_id' column is required to build a TrendPanel.")
+        if features is None:
+            features = df.select_dtypes(include=[np.number]).columns.tolist()
+        n_rows = len(df)
+
+        def codes_for(col):
+            if col not in df.columns:
+                return np.zeros(n_rows, dtype=np.int64), np.array([""], dtype=object)
+            codes, uniques = pd.factorize(df[col].fillna("").astype(str), sort=True)
+            return codes.astype(np.int64), np.asarray(uniques, dtype=object)
+
+        domain_row, domain_names = codes_for("domain")
+        trend_row, trend_names = codes_for("trend_id")
+        ts_row, timestamps = codes_for("timestamp")
+        blurb_row, blurbs = codes_for("text_blurb")
+
+        # Each trend must live in a single domain, otherwise it would be split
+        domains_per_trend = np.bincount(
+            np.unique(trend_row * len(domain_names) + domain_row) // len(domain_names),
+            minlength=len(trend_names),
+        )
+        if (domains_per_trend > 1).any():
+            spanning = trend_names[domains_per_trend > 1].tolist()
+            raise ValueError(f"trend_id(s) {spanning} appear under more than one domain.")
+
+        # Group rows by (domain, trend), ordered in time within each trend
+        order = np.lexsort((np.arange(n_rows), ts_row, trend_row, domain_row))
+        sorted_trend = trend_row[order]
+        starts = np.flatnonzero(np.r_[True, sorted_trend[1:] != sorted_trend[:-1]]) if n_rows else np.array([], dtype=np.int64)
+        offsets = np.r_[starts, n_rows].astype(np.int64)
+
+        source_rows = np.empty(n_rows, dtype=np.int64)
+        source_rows[order] = np.arange(n_rows)
+
+        first = order[starts]
+        return cls(
+            values=np.ascontiguousarray(df[features].to_numpy(dtype=dtype, na_value=np.nan)[order]),
+            offsets=offsets,
+            feature_names=features,
+            trend_ids=trend_names[trend_row[first]],
+            domain_codes=domain_row[first].astype(np.int32),
+            domain_names=domain_names,
+            timestamp_codes=ts_row[order].astype(np.int32),
+            timestamps=timestamps,
+            blurb_codes=blurb_row[order].astype(np.int32),
+            blurbs=blurbs,
+            source_rows=source_rows,
+        )
+
+    # ------------------------------------------------------------------
+    # 2. ZERO-COPY VIEWS
+    # ------------------------------------------------------------------
+    def __len__(self):
+        return len(self.lengths)
+
+    @property
+    def n_rows(self):
+        return len(self.values)
+
+    @property
+    def nbytes(self):
+        arrays = [self.values, self.offsets, self.domain_codes, self.timestamp_codes,
+                  self.blurb_codes, self.source_rows]
+        return sum(a.nbytes for a in arrays)
+
+    def feature_index(self, name):
+        if name not in self._feature_lookup:
+            raise KeyError(f"Unknown feature '{name}'.")
+        return self._feature_lookup[name]
+
+    def trend(self, trend_id):
+        """(months × features) view of a single trend."""
+        i = self._trend_lookup[trend_id]
+        return self.values[self.offsets[i]:self.offsets[i + 1]]
+
+    def domain_slice(self, name):
+        """Slice of panel rows belonging to a domain."""
+        d = self._domain_lookup[name]
+        return slice(int(self.offsets[self.domain_offsets[d]]), int(self.offsets[self.domain_offsets[d + 1]]))
+
+    def domain(self, name):
+        """(rows × features) view of every trend in a domain, trend after trend."""
+        return self.values[self.domain_slice(name)]
+
+    def row_trends(self):
+        """Trend index of every panel row."""
+        return np.repeat(np.arange(len(self)), self.lengths)
+
+    def row_positions(self):
+        """Month position of every panel row within its trend."""
+        return np.arange(self.n_rows) - np.repeat(self.offsets[:-1], self.lengths)
+
+    # ------------------------------------------------------------------
+    # 3. ROW-ORDER ACCESS (for DataFrame round-trips)
+    # ------------------------------------------------------------------
+    def to_rows(self, rows):
+        """Gather a per-panel-row array back into source row order."""
+        return rows[self.source_rows]
+
+    def column(self, name):
+        return self.values[self.source_rows, self.feature_index(name)]
+
+    def matrix(self, columns):
+        idx = [self.feature_index(c) for c in columns]
+        return self.values[self.source_rows[:, None], idx]
+
+    # ------------------------------------------------------------------
+    # 4. HEARTBEAT
+    # ------------------------------------------------------------------
+    def heartbeat(self, features=None):
+        """
+        Per-row mean across features (the same signal get_cultural_heartbeat
+        computes), in panel row order. NaN features are skipped.
+        """
+        values = self.values
+        if features is not None:
+            values = values[:, [self.feature_index(f) for f in features]]
+        valid = ~np.isnan(values)
+        total = np.where(valid, values, 0.0).sum(axis=1)
+        count = valid.sum(axis=1)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return (total / count).astype(values.dtype)
+
+
+def load_trend_panel(path: str = "data/trends_seed.csv"):
+    """Load and normalize the trend CSV straight into a TrendPanel."""
+    return TrendPanel.from_frame(load_trend_data(path))
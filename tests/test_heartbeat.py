@@ -0,0 +1,104 @@
+import numpy as np
+import pandas as pd
+
+from data.build_features import get_cultural_heartbeat, load_trend_data
+from data.heartbeat import DomainHeartbeat
+from data.params import DOMAIN_NAMES
+from data.trend_panel import TrendPanel
+
+
+def make_frame(n=20000, seed=0):
+    rng = np.random.default_rng(seed)
+    domains = np.array(DOMAIN_NAMES + ["beauty"])
+    months = np.array([f"{y}-{m:02d}" for y in range(2000, 2010) for m in range(1, 13)])
+    domain = domains[rng.integers(0, len(domains), n)]
+    return pd.DataFrame({
+        "a": rng.normal(size=n),
+        "b": rng.normal(size=n),
+        "axis_label": np.sign(rng.normal(size=n)),
+        "domain": domain,
+        "trend_id": np.char.add(domain, rng.integers(0, 20, n).astype(str)),
+        "timestamp": months[rng.integers(0, len(months), n)],
+    })
+
+
+def reference(df):
+    hb = get_cultural_heartbeat(df.drop(columns=["axis_label"]))
+    return df.assign(h=hb).groupby(["domain", "timestamp"]).h.mean()
+
+
+def test_matches_groupby_and_ignores_axis_label():
+    df = make_frame()
+    months, curves = DomainHeartbeat.from_frame(df).heartbeats()
+    assert set(DOMAIN_NAMES) <= set(curves)
+    for (domain, month), value in reference(df).items():
+        assert np.isclose(curves[domain][np.searchsorted(months, month)], value)
+
+
+def test_incremental_matches_full_build():
+    df = make_frame()
+    full = DomainHeartbeat.from_frame(df)
+    inc = DomainHeartbeat()
+    # Later months first, so the month axis has to be re-indexed as rows land
+    for part in np.array_split(np.arange(len(df)), 5)[::-1]:
+        inc.add_rows(df.sort_values("timestamp").iloc[part])
+        inc.heartbeats()
+
+    np.testing.assert_array_equal(inc.months, full.months)
+    for name in full.domains:
+        np.testing.assert_allclose(inc.domain(name), full.domain(name))
+    np.testing.assert_allclose(inc.total(), full.total())
+
+
+def test_new_rows_invalidate_cache():
+    df = make_frame()
+    hb = DomainHeartbeat.from_frame(df)
+    before = hb.domain("music").copy()
+    hb.add_rows(pd.DataFrame({"a": [10.0], "b": [10.0], "domain": ["music"], "timestamp": [hb.months[0]]}))
+    assert hb.domain("music")[0] > before[0]
+    np.testing.assert_array_equal(hb.domain("music")[1:], before[1:])
+
+
+def test_from_panel_matches_from_frame():
+    df = load_trend_data()
+    a = DomainHeartbeat.from_panel(TrendPanel.from_frame(df, dtype=np.float64))
+    b = DomainHeartbeat.from_frame(df)
+    np.testing.assert_array_equal(a.months, b.months)
+    np.testing.assert_allclose(a.total(), b.total())
+
+
+def test_rows_with_missing_metadata_are_skipped():
+    df = make_frame()
+    expected = DomainHeartbeat.from_frame(df)
+
+    missing = pd.DataFrame({
+        "a": [5.0, 5.0, 5.0], "b": [5.0, 5.0, 5.0],
+        "domain": [None, "tech", np.nan], "timestamp": ["2000-01", None, None],
+    })
+    hb = DomainHeartbeat.from_frame(pd.concat([df, missing], ignore_index=True))
+    assert hb.domains == expected.domains
+    np.testing.assert_array_equal(hb.months, expected.months)
+    np.testing.assert_allclose(hb.total(), expected.total())
+
+    empty = DomainHeartbeat.from_frame(missing.assign(domain=None))
+    assert len(empty.months) == 0
+
+
+def test_accumulate_ignores_missing_codes():
+    hb = DomainHeartbeat()
+    hb._accumulate(
+        np.array(["tech", None, "tech"], dtype=object),
+        np.array(["2000-01", "2000-01", None], dtype=object),
+        np.array([1.0, 5.0, 5.0]),
+    )
+    np.testing.assert_array_equal(hb.months, ["2000-01"])
+    assert hb.domain("tech")[0] == 1.0
+    assert np.isnan(hb.domain("music")[0])
+
+
+def test_from_panel_skips_missing_metadata():
+    df = load_trend_data()
+    extra = df.iloc[:1].assign(trend_id="unlabelled", domain=None)
+    a = DomainHeartbeat.from_panel(TrendPanel.from_frame(pd.concat([df, extra], ignore_index=True)))
+    assert "" not in a.domains
+    np.testing.assert_allclose(a.total(), DomainHeartbeat.from_frame(df).total(), rtol=1e-6)
@@ -0,0 +1,71 @@
+import json
+
+import numpy as np
+import pytest
+
+from data import model_utils as mu
+
+
+class LinearModel:
+    """Stand-in for the Ridge model: predict is row-wise, so batch and single calls agree."""
+
+    def __init__(self, weights):
+        self.weights = weights
+
+    def predict(self, X):
+        return np.array([float(np.dot(row, self.weights)) for row in X])
+
+
+@pytest.fixture
+def batch():
+    rng = np.random.default_rng(0)
+    X = rng.normal(size=(500, 9))
+    signals = rng.normal(scale=rng.uniform(0, 0.6, size=(500, 1)), size=(500, 50))
+    return LinearModel(rng.normal(size=9)), X, signals
+
+
+def test_batch_matches_single_row(batch):
+    model, X, signals = batch
+    labels, confidences, _ = mu.predict_axis_batch(model, X)
+    explanations, _ = mu.explain_graph_batch(signals, labels)
+    summaries = mu.describe_prediction_batch(labels, confidences)
+
+    for i in range(len(X)):
+        label, conf, _ = mu.predict_axis(model, dict(enumerate(X[i])))
+        assert labels[i] == label
+        assert confidences[i] == conf
+        assert explanations[i] == mu.explain_graph(signals[i], None, label)
+        assert summaries[i] == mu.describe_prediction(label, conf)
+
+
+def test_nan_signal_matches_single_row():
+    signal = np.array([0.0, np.nan, 1.0])
+    explanations, _ = mu.explain_graph_batch(signal[None, :], ["Order"])
+    assert explanations[0] == mu.explain_graph(signal, None, "Order")
+
+
+def test_out_of_range_confidence_formatting():
+    confidences = [1.7, -0.2, -0.004, 0.004]
+    summaries = mu.describe_prediction_batch(["Novelty", "Order", "Order", "Order"], confidences)
+    for summary, label, conf in zip(summaries, ["Novelty", "Order", "Order", "Order"], confidences):
+        assert summary == mu.describe_prediction(label, conf)
+
+
+def test_unknown_label_raises():
+    with pytest.raises(ValueError):
+        mu.explain_graph_batch(np.zeros((1, 3)), ["Neutral"])
+    with pytest.raises(ValueError):
+        mu.describe_prediction_batch(["Neutral"], [0.5])
+
+
+def test_write_narratives_jsonl(batch, tmp_path):
+    model, X, signals = batch
+    path = tmp_path / "narratives.jsonl"
+    count = mu.write_narratives_jsonl(path, model, X, signals, keys=np.arange(len(X)), chunk_size=77)
+
+    records = [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+    assert count == len(records) == len(X)
+    assert [r["key"] for r in records] == list(range(len(X)))
+    label, conf, _ = mu.predict_axis(model, dict(enumerate(X[123])))
+    assert records[123]["label"] == label
+    assert records[123]["summary"] == mu.describe_prediction(label, conf)
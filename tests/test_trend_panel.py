@@ -0,0 +1,88 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from data.build_features import get_cultural_heartbeat, load_trend_data
+from data.parallels import PARALLEL_FEATS, add_parallel_sims
+from data.trend_panel import TrendPanel
+
+
+def make_frame(seed=1):
+    rng = np.random.default_rng(seed)
+    rows = []
+    for tid, domain, n in [("a", "fashion", 300), ("b", "music", 250), ("c", "fashion", 100)]:
+        for i in range(n):
+            row = {"trend_id": tid, "domain": domain, "timestamp": f"{2000 + i // 12}-{i % 12 + 1:02d}"}
+            row.update({f: rng.normal() for f in PARALLEL_FEATS})
+            rows.append(row)
+    return pd.DataFrame(rows).sample(frac=1, random_state=0).reset_index(drop=True)
+
+
+def naive_sims(X, delta):
+    out = np.zeros(len(X))
+    for i in range(delta, len(X)):
+        a, b = X[i], X[i - delta]
+        out[i] = (a * b).sum() / (np.linalg.norm(a) * np.linalg.norm(b) + 1e-9)
+    return out
+
+
+def test_views_share_memory_and_cover_all_rows():
+    df = make_frame()
+    panel = TrendPanel.from_frame(df, features=PARALLEL_FEATS)
+
+    assert panel.n_rows == len(df)
+    assert list(panel.lengths) == [300, 100, 250]
+    for tid, g in df.groupby("trend_id"):
+        view = panel.trend(tid)
+        assert np.shares_memory(view, panel.values)
+        expected = g.sort_values("timestamp")[PARALLEL_FEATS].to_numpy(dtype=np.float32)
+        np.testing.assert_array_equal(view, expected)
+
+    fashion = panel.domain("fashion")
+    assert np.shares_memory(fashion, panel.values)
+    assert len(fashion) == 400
+
+
+def test_row_order_round_trip():
+    df = make_frame()
+    panel = TrendPanel.from_frame(df, dtype=np.float64)
+    np.testing.assert_array_equal(panel.matrix(PARALLEL_FEATS), df[PARALLEL_FEATS].to_numpy())
+    np.testing.assert_array_equal(panel.column("gt_search"), df["gt_search"].to_numpy())
+
+
+def test_trend_spanning_domains_raises():
+    df = make_frame()
+    df.loc[0, "domain"] = "tech"
+    with pytest.raises(ValueError):
+        TrendPanel.from_frame(df)
+
+
+def test_heartbeat_matches_dataframe():
+    df = load_trend_data()
+    panel = TrendPanel.from_frame(df, dtype=np.float64)
+    np.testing.assert_allclose(panel.to_rows(panel.heartbeat()), get_cultural_heartbeat(df))
+
+
+def test_parallel_sims_match_loop():
+    out = add_parallel_sims(make_frame())
+    for _, g in out.groupby("trend_id"):
+        g = g.sort_values("timestamp")
+        X = g[PARALLEL_FEATS].to_numpy()
+        np.testing.assert_allclose(g["par_sim_10y"].to_numpy(), naive_sims(X, 120), atol=1e-12)
+        np.testing.assert_allclose(g["par_sim_20y"].to_numpy(), naive_sims(X, 240), atol=1e-12)
+
+
+def test_parallel_sims_ignore_domain():
+    df = make_frame()
+    df.loc[df["trend_id"] == "a", "domain"] = np.where(np.arange((df["trend_id"] == "a").sum()) % 2, "tech", "fashion")
+    out = add_parallel_sims(df)
+    g = out[out["trend_id"] == "a"].sort_values("timestamp")
+    np.testing.assert_allclose(g["par_sim_10y"].to_numpy(), naive_sims(g[PARALLEL_FEATS].to_numpy(), 120), atol=1e-12)
+
+
+def test_float64_panel_reproduces_training_matrix():
+    df = pd.read_csv("data/features.csv").dropna(subset=["axis_label"])
+    panel = TrendPanel.from_frame(df, dtype=np.float64)
+    cols = [c for c in df.select_dtypes(include=[np.number]).columns if c != "axis_label"]
+    np.testing.assert_array_equal(panel.matrix(cols), df[cols].to_numpy())
+    np.testing.assert_array_equal(panel.column("axis_label"), df["axis_label"].to_numpy())
@@ -1,7 +1,10 @@
 import streamlit as st
 import numpy as np
+import pandas as pd
 import plotly.graph_objects as go
 from data.model_utils import load_model, predict_axis, explain_graph
+from data.trend_panel import load_trend_panel
+from data.heartbeat import DomainHeartbeat
 
 # ---------------------------------------------------------
 # Setup & Load Model
@@ -12,7 +15,12 @@ st.set_page_config(page_title="The Pendulum Wheel", layout="wide")
 def get_model():
     return load_model("backend/axis_model.pkl")
 
+@st.cache_resource
+def get_heartbeat():
+    return DomainHeartbeat.from_panel(load_trend_panel())
+
 model = get_model()
+heartbeat = get_heartbeat()
 
 # ---------------------------------------------------------
 # 🌫️ BACKGROUND (Same as Before — Dark, Fluid, X-ray)
@@ -205,19 +213,24 @@ if user_msg:
 st.markdown("### The Pendulum Wheel: Cultural Shift Over Time")
 
 domains = {
-    "Fashion": "#B8A7FF",
-    "Technology": "#A3F0E0",
-    "Economy": "#FFF5AA",
-    "Music": "#DAB3FF",
-    "Social Mood": "#A8AFFF"
+    "Fashion": ("fashion", "#B8A7FF"),
+    "Technology": ("tech", "#A3F0E0"),
+    "Economy": ("economics", "#FFF5AA"),
+    "Music": ("music", "#DAB3FF"),
+    "Social Mood": ("politics", "#A8AFFF")
 }
-t = np.linspace(0, 20, 200)
+months, curves = heartbeat.heartbeats([key for key, _ in domains.values()])
+dates = pd.to_datetime(pd.Series(months, dtype=str), errors="coerce")
+years = (dates.dt.year + (dates.dt.month - 1) / 12 - dates.dt.year.min()).to_numpy()
 fig = go.Figure()
-for i, (domain, color) in enumerate(domains.items()):
-    signal = np.sin(t / (2 + i * 0.3)) + 0.3 * np.cos(t / (3 + i * 0.2))
+for i, (domain, (key, color)) in enumerate(domains.items()):
+    has_data = ~np.isnan(curves[key]) & ~np.isnan(years)
+    t = years[has_data]
+    signal = curves[key][has_data]
     fig.add_trace(go.Scatter3d(
         x=t, y=signal, z=np.full_like(t, i * 0.4),
-        mode="lines", line=dict(color=color, width=6), name=domain,
+        mode="lines", line=dict(color=color, width=6),
+        name=domain if has_data.any() else f"{domain} (no data)", showlegend=True,
         hovertemplate=f"<b>{domain}</b><br>Year: %{{x:.1f}}<br>Energy: %{{y:.2f}}<extra></extra>"
     ))
 fig.update_layout(